@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import math
 
@@ -5,10 +6,18 @@ import math
 
 FILE_PATH = './emergency_events.csv'
 OUTPUT_PATH = './output.csv'
+OUTCOME_PATH = './outcomes.csv'
 
 DEFAULT_SPEED = 1   # 1 unit/s
 VERBOSE = False
 
+# unit types that may respond to each emergency type
+APPLICABLE_UNITS = {
+    'fire': ['fire'],
+    'police': ['police', 'medical'],
+    'medical': ['medical', 'fire'],
+}
+
 
 
 
@@ -38,24 +47,24 @@ class Unit:
         
 
 class Emergency:
-    def __init__(self, id, x, y, etype, prio, expire_time):
+    def __init__(self, id, x, y, etype, prio, expire_time, time=None):
         self.id = id
+        self.time = expire_time - prio if time is None else time
         self.x = x
         self.y = y
         self.etype = etype
         self.prio = prio
         self.expire_time = expire_time
         self.is_active = True
+
+        # outcome tracking
+        self.station_id = None
+        self.unit = None            # name of the dispatched unit
+        self.dispatch_time = None
+        self.arrival_time = None
         
         
-        if self.etype == 'fire':
-            self.applicable_units = ['fire']
-        elif self.etype == 'police':
-            self.applicable_units = ['police', 'medical']
-        elif self.etype == 'medical':
-            self.applicable_units = ['medical', 'fire']
-        else:
-            self.applicable_units = []
+        self.applicable_units = APPLICABLE_UNITS.get(self.etype, [])
 
 
 
@@ -93,6 +102,38 @@ def create_units_from_stations(stations, default_speed=1.0):
     return units
 
 
+def build_outcome_table(emergencies):
+    """
+    One row per emergency: who was sent, when, and how it ended.
+    response_time is arrival minus call time, slack is expire_time minus arrival
+    (negative when the unit arrived late). A call is 'served' if a unit arrived
+    by expire_time, 'expired' if it arrived late or never came before the last
+    event, and 'pending' otherwise.
+    """
+    outcomes = pd.DataFrame({
+        'id': [e.id for e in emergencies],
+        'etype': [e.etype for e in emergencies],
+        't': [e.time for e in emergencies],
+        'expire_time': [e.expire_time for e in emergencies],
+        'station_id': [e.station_id for e in emergencies],
+        'unit': [e.unit for e in emergencies],
+        'dispatch_time': [e.dispatch_time for e in emergencies],
+        'arrival_time': [e.arrival_time for e in emergencies],
+    })
+    for col in ['t', 'expire_time', 'dispatch_time', 'arrival_time']:
+        outcomes[col] = outcomes[col].astype(float)
+    outcomes['response_time'] = outcomes['arrival_time'] - outcomes['t']
+    outcomes['slack'] = outcomes['expire_time'] - outcomes['arrival_time']
+
+    arrived = outcomes['arrival_time'].notna()
+    served = arrived & (outcomes['slack'] >= 0)
+    expired = (arrived & (outcomes['slack'] < 0)) | (~arrived & (outcomes['expire_time'] < outcomes['t'].max()))
+    outcomes['outcome'] = np.select([served, expired], ['served', 'expired'], 'pending')
+    for col in ['etype', 'station_id', 'unit', 'outcome']:
+        outcomes[col] = outcomes[col].astype('category')
+    return outcomes
+
+
 def main():
     points = 0
 
@@ -104,6 +145,7 @@ def main():
     # INITIALIZE UNITS
     units = create_units_from_stations(stations, DEFAULT_SPEED)
     emergency_stack = []
+    emergencies = []    # every emergency seen, for the outcome table
 
 
 
@@ -141,6 +183,7 @@ def main():
                 if unit.done_busy_time < curr_time:
                     if VERBOSE: print(f"AAAAA - UNIT AT TARGET! {unit.name}")
                     # unit is at target, should be free again to go to next emergency!
+                    unit.target.arrival_time = unit.done_busy_time
                     unit.x = unit.target.x
                     unit.y = unit.target.y
                     unit.is_busy = False
@@ -200,9 +243,11 @@ def main():
                             y=row['y'], 
                             etype=row['etype'], 
                             prio=row['priority_s'],
-                            expire_time=curr_time + row['priority_s'])
+                            expire_time=curr_time + row['priority_s'],
+                            time=curr_time)
 
         emergency_stack.append(emergency)
+        emergencies.append(emergency)
         if VERBOSE: print(f"New emergency! At {curr_time}") 
         
         # Find closest applicable unit to emergency
@@ -233,6 +278,9 @@ def main():
             best_unit.is_busy = True
             best_unit.done_busy_time = curr_time + get_time_to_emergency(best_unit, emergency)
             best_unit.target = emergency
+            emergency.station_id = best_unit.station_id
+            emergency.unit = best_unit.name
+            emergency.dispatch_time = curr_time
 
 
 
@@ -245,6 +293,10 @@ def main():
     print(f"Simulation complete! Saved position log to {OUTPUT_PATH}")
     data.to_csv(OUTPUT_PATH)
 
+    outcomes = build_outcome_table(emergencies)
+    outcomes.to_csv(OUTCOME_PATH, index=False)
+    print(f"Saved per-emergency outcomes to {OUTCOME_PATH}")
+
 
 
 if __name__ == "__main__":
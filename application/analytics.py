@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from algorithm import OUTCOME_PATH
+
+
+
+PERCENTILES = (0.5, 0.9, 0.95, 0.99)
+BUCKET_S = 3600     # rollup bucket width (s)
+
+CATEGORY_COLS = ['etype', 'station_id', 'unit', 'outcome']
+
+
+
+
+def load_outcomes(path=OUTCOME_PATH):
+    """Read the per-emergency outcome table written by algorithm.py."""
+    return pd.read_csv(path, dtype={col: 'category' for col in CATEGORY_COLS})
+
+
+def response_percentiles(outcomes, percentiles=PERCENTILES):
+    """Response time percentiles over every call a unit reached."""
+    return outcomes['response_time'].dropna().quantile(list(percentiles))
+
+
+def breakdown(outcomes, by, percentiles=PERCENTILES):
+    """
+    Counts, served/expired rates, mean slack and response time percentiles
+    per group. by is any column (or list of columns) of the outcome table.
+    """
+    grouped = outcomes.assign(
+        served=(outcomes['outcome'] == 'served'),
+        expired=(outcomes['outcome'] == 'expired'),
+    ).groupby(by, observed=True, dropna=False)
+
+    table = grouped.agg(
+        calls=('id', 'size'),
+        served=('served', 'sum'),
+        expired=('expired', 'sum'),
+        mean_response=('response_time', 'mean'),
+        mean_slack=('slack', 'mean'),
+    )
+    table['served_rate'] = table['served'] / table['calls']
+    table['expired_rate'] = table['expired'] / table['calls']
+
+    quantiles = grouped['response_time'].quantile(list(percentiles)).unstack()
+    quantiles.columns = [f"p{round(q * 100):g}_response" for q in quantiles.columns]
+    return table.join(quantiles)
+
+
+def time_rollup(outcomes, bucket_s=BUCKET_S, percentiles=PERCENTILES):
+    """breakdown() over fixed-width buckets of call time, indexed by bucket start."""
+    bucket = (np.floor(outcomes['t'] / bucket_s) * bucket_s).rename('bucket')
+    return breakdown(outcomes.assign(bucket=bucket), 'bucket', percentiles)
+
+
+def main():
+    outcomes = load_outcomes(OUTCOME_PATH)
+
+    print("Response time percentiles (s)")
+    print(response_percentiles(outcomes).to_string())
+    print("\nBy emergency type")
+    print(breakdown(outcomes, 'etype').to_string())
+    print("\nBy responding station")
+    print(breakdown(outcomes, 'station_id').to_string())
+    print(f"\nBy {BUCKET_S}s bucket")
+    print(time_rollup(outcomes).to_string())
+
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,18 @@ GRID_W, GRID_H = 200,200
 BG_COLOR = "#000000"
 ZOOM = 3
 
+STATION_COLORS = {
+    "fire": "#FF0000",
+    "police": "#002FFF",
+    "medical": "#FFE607",
+}
+EMERGENCY_COLORS = {
+    "fire": "#FF8800",
+    "police": "#00CCFF",
+    "medical": "#FF00E1",
+}
+UNKNOWN_COLOR = "#808080"
+
 def parse_time_to_seconds(s):
     s = s.strip()
     if not s:
@@ -111,14 +123,7 @@ class EmergencyPlayer:
 
             x = e['x']
             y = e['y']
-            if e['type'] == 'fire':
-                color = "#FF8800"
-            elif e['type'] == 'police':
-                color = "#00CCFF"
-            elif e['type'] == 'medical':
-                color = "#FF00E1"
-            else:
-                color = "#808080"
+            color = EMERGENCY_COLORS.get(e['type'], UNKNOWN_COLOR)
             pid = self.pg.add_pixel(x, y, color)
 
             self.next_idx += 1
@@ -207,17 +212,17 @@ def build_ui(root):
     legend_frame = tk.Frame(frame)
     legend_frame.pack()
     tk.Label(legend_frame, text="Legend: ", font=("TkDefaultFont", 11, "bold")).pack(side='left')
-    tk.Label(legend_frame, text="■ Fire Station", fg="#FF0000").pack(side='left', padx=8)
-    tk.Label(legend_frame, text="■ Police Station", fg="#002FFF").pack(side='left', padx=8)
-    tk.Label(legend_frame, text="■ Medical Station", fg="#FFE607").pack(side='left', padx=8)
+    tk.Label(legend_frame, text="■ Fire Station", fg=STATION_COLORS["fire"]).pack(side='left', padx=8)
+    tk.Label(legend_frame, text="■ Police Station", fg=STATION_COLORS["police"]).pack(side='left', padx=8)
+    tk.Label(legend_frame, text="■ Medical Station", fg=STATION_COLORS["medical"]).pack(side='left', padx=8)
 
     #legend for emergencies
     legend_frame2 = tk.Frame(frame)
     legend_frame2.pack()
     tk.Label(legend_frame2, text="Emergencies: ", font=("TkDefaultFont", 11, "bold")).pack(side='left')
-    tk.Label(legend_frame2, text="■ Fire Emergency", fg="#FF8800").pack(side='left', padx=8)
-    tk.Label(legend_frame2, text="■ Police Emergency", fg="#00CCFF").pack(side='left', padx=8)
-    tk.Label(legend_frame2, text="■ Medical Emergency", fg="#FF00E1").pack(side='left', padx=8)
+    tk.Label(legend_frame2, text="■ Fire Emergency", fg=EMERGENCY_COLORS["fire"]).pack(side='left', padx=8)
+    tk.Label(legend_frame2, text="■ Police Emergency", fg=EMERGENCY_COLORS["police"]).pack(side='left', padx=8)
+    tk.Label(legend_frame2, text="■ Medical Emergency", fg=EMERGENCY_COLORS["medical"]).pack(side='left', padx=8)
 
     # Event log
     log_frame = tk.Frame(frame)
@@ -247,12 +252,12 @@ def build_ui(root):
     tk.Label(grid_frame, text="Winnipeg, MB", font=("TkDefaultFont", 11, "bold")).pack()
 
     stations = [
-        (20, 20, "#FF0000"),   # Fire Station 1
-        (180, 20, "#FF0000"),  # Fire Station 2
-        (50, 100, "#002FFF"),  # Police Station 1
-        (150, 120, "#002FFF"), # Police Station 2
-        (100, 30, "#FFE607"),  # Medical Station 1
-        (100, 170, "#FFE607"), # Medical Station 2
+        (20, 20, STATION_COLORS["fire"]),      # Fire Station 1
+        (180, 20, STATION_COLORS["fire"]),     # Fire Station 2
+        (50, 100, STATION_COLORS["police"]),   # Police Station 1
+        (150, 120, STATION_COLORS["police"]),  # Police Station 2
+        (100, 30, STATION_COLORS["medical"]),  # Medical Station 1
+        (100, 170, STATION_COLORS["medical"]), # Medical Station 2
     ]
 
     for x, y, color in stations:
@@ -0,0 +1,177 @@
+import numpy as np
+import pandas as pd
+
+from algorithm import (FILE_PATH, DEFAULT_SPEED, APPLICABLE_UNITS,
+                       import_data, build_initial_stations, create_units_from_stations)
+
+
+
+OUTPUT_PATH = './montecarlo.csv'
+
+N_SCENARIOS = 500
+MODE = 'jitter'         # 'jitter', 'bootstrap' or 'none'
+TIME_SIGMA = 60.0       # std dev of arrival time jitter (s)
+POS_SIGMA = 5.0         # std dev of location jitter (grid units)
+GRID_W, GRID_H = 200, 200
+PERCENTILES = (5, 50, 95)
+SEED = 0
+
+ETYPES = list(APPLICABLE_UNITS)     # etype code -> name, anything else is coded len(ETYPES)
+
+
+
+
+def perturb_events(data, n_scenarios, mode=MODE, rng=None):
+    """
+    Build (S, N) event arrays for n_scenarios perturbed copies of data.
+    'jitter' adds gaussian noise to arrival time and location,
+    'bootstrap' resamples rows with replacement, 'none' repeats the input as is.
+    Each scenario is sorted by time along axis 1.
+    """
+    if rng is None:
+        rng = np.random.default_rng(SEED)
+
+    t = data['t'].to_numpy(dtype=float)
+    x = data['x'].to_numpy(dtype=float)
+    y = data['y'].to_numpy(dtype=float)
+    prio = data['priority_s'].to_numpy(dtype=float)
+    codes = pd.Categorical(data['etype'], categories=ETYPES).codes.astype(np.int64)
+    codes[codes < 0] = len(ETYPES)
+    n = len(t)
+    shape = (n_scenarios, n)
+
+    if mode == 'jitter':
+        t = np.clip(t + rng.normal(0.0, TIME_SIGMA, shape), 0.0, None)
+        x = np.clip(x + rng.normal(0.0, POS_SIGMA, shape), 0.0, GRID_W)
+        y = np.clip(y + rng.normal(0.0, POS_SIGMA, shape), 0.0, GRID_H)
+        prio = np.broadcast_to(prio, shape)
+        codes = np.broadcast_to(codes, shape)
+    elif mode == 'bootstrap':
+        pick = rng.integers(0, n, shape)
+        t, x, y, prio, codes = t[pick], x[pick], y[pick], prio[pick], codes[pick]
+    elif mode == 'none':
+        t, x, y, prio, codes = (np.broadcast_to(a, shape) for a in (t, x, y, prio, codes))
+    else:
+        raise ValueError(f"Unknown Monte Carlo mode '{mode}'")
+
+    order = np.argsort(t, axis=1, kind='stable')
+    take = lambda a: np.take_along_axis(a, order, axis=1)
+    return {
+        't': take(t),
+        'x': take(x),
+        'y': take(y),
+        'prio': take(prio),
+        'etype': take(codes),
+    }
+
+
+def simulate_batch(events, units):
+    """
+    Run the greedy dispatcher from algorithm.py over all scenarios in lockstep.
+    Every array carries the scenario dimension first: unit state is (S, U),
+    emergency state is (S, N). Points follow algorithm.main() exactly,
+    intermediate unit positions while en route are not tracked since they
+    never affect dispatch or points.
+    Served and expired counts follow algorithm.build_outcome_table(): a call is
+    served if its unit arrived by expire_time, expired if it arrived late or
+    never came before the last event.
+    Returns per-scenario score, served count and expired count.
+    """
+    t, ex, ey = events['t'], events['x'], events['y']
+    expire = t + events['prio']
+    etype = events['etype']
+    n_scen, n_events = t.shape
+    rows = np.arange(n_scen)
+
+    # applicable[etype code, unit] - last row is for unknown etypes
+    applicable = np.zeros((len(ETYPES) + 1, len(units)), dtype=bool)
+    for code, name in enumerate(ETYPES):
+        applicable[code] = [unit.stype in APPLICABLE_UNITS[name] for unit in units]
+    speed = np.array([unit.speed for unit in units], dtype=float)
+
+    # unit state
+    ux = np.tile(np.array([unit.home_x for unit in units], dtype=float), (n_scen, 1))
+    uy = np.tile(np.array([unit.home_y for unit in units], dtype=float), (n_scen, 1))
+    busy = np.zeros(ux.shape, dtype=bool)
+    done_busy_time = np.zeros(ux.shape)
+    target = np.zeros(ux.shape, dtype=np.int64)
+
+    # emergency state
+    on_stack = np.zeros((n_scen, n_events), dtype=bool)
+    reached = np.zeros((n_scen, n_events), dtype=bool)
+    lo = 0
+
+    points = np.zeros(n_scen)
+    served = np.zeros(n_scen, dtype=np.int64)
+    expired = np.zeros(n_scen, dtype=np.int64)
+
+    for k in range(n_events):
+        curr_time = t[:, k]
+
+        # units arriving at their target
+        arrived = busy & (done_busy_time < curr_time[:, None])
+        if arrived.any():
+            s, u = np.nonzero(arrived)
+            tgt = target[s, u]
+            ux[s, u] = ex[s, tgt]
+            uy[s, u] = ey[s, tgt]
+            on_time = done_busy_time[s, u] <= expire[s, tgt]
+            np.add.at(served, s, on_time)
+            np.add.at(expired, s, ~on_time)
+            reached[s, tgt] = True
+            busy[s, u] = False
+            done_busy_time[s, u] = 0
+            on_stack[s, tgt] = False
+            remaining_time = curr_time[s] - expire[s, tgt]
+            np.add.at(points, s, np.trunc(remaining_time / 60))
+
+        # emergencies expiring on the stack, everything before lo is already off it
+        while lo < k and not on_stack[:, lo].any():
+            lo += 1
+        gone = on_stack[:, lo:k] & (expire[:, lo:k] < curr_time[:, None])
+        points -= 2 * gone.sum(axis=1)
+        on_stack[:, lo:k] &= ~gone
+
+        # new emergency, greedy dispatch of the closest free applicable unit
+        on_stack[:, k] = True
+        cost = np.hypot(ex[:, k, None] - ux, ey[:, k, None] - uy) / speed
+        ok = ~busy & applicable[etype[:, k]] & ~(cost > expire[:, k, None])
+        cost = np.where(ok, cost, np.inf)
+        best = np.argmin(cost, axis=1)
+        best_cost = cost[rows, best]
+        s = np.nonzero(np.isfinite(best_cost))[0]
+        u = best[s]
+        busy[s, u] = True
+        done_busy_time[s, u] = curr_time[s] + best_cost[s]
+        target[s, u] = k
+
+    # calls no unit reached that were past their deadline by the last event
+    expired += (~reached & (expire < t[:, -1:])).sum(axis=1)
+
+    return pd.DataFrame({'points': points, 'served': served, 'expired': expired})
+
+
+def summarize(results, percentiles=PERCENTILES):
+    """Mean and percentile bands per metric, one row per metric."""
+    summary = pd.DataFrame({'mean': results.mean()})
+    for p, col in zip(percentiles, np.percentile(results.to_numpy(), percentiles, axis=0)):
+        summary[f"p{p}"] = col
+    return summary
+
+
+def main():
+    data = import_data(FILE_PATH)
+    units = create_units_from_stations(build_initial_stations(), DEFAULT_SPEED)
+
+    events = perturb_events(data, N_SCENARIOS, MODE, np.random.default_rng(SEED))
+    results = simulate_batch(events, units)
+    results.to_csv(OUTPUT_PATH, index_label='scenario')
+
+    print(f"Monte Carlo ({MODE}, {N_SCENARIOS} scenarios)")
+    print(summarize(results).to_string(float_format=lambda v: f"{v:.1f}"))
+    print(f"Saved per-scenario results to {OUTPUT_PATH}")
+
+
+
+if __name__ == "__main__":
+    main()
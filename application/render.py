@@ -0,0 +1,205 @@
+import os
+import sys
+import struct
+import zlib
+from multiprocessing import Pool
+
+import numpy as np
+import pandas as pd
+
+from algorithm import OUTPUT_PATH, OUTCOME_PATH, build_initial_stations
+from display import GRID_W, GRID_H, BG_COLOR, ZOOM, STATION_COLORS, EMERGENCY_COLORS, UNKNOWN_COLOR
+
+
+
+INPUT_PATH = OUTPUT_PATH        # position log written by algorithm.py
+OUTPUT_FORMAT = 'png'           # 'png' for a PNG sequence, 'raw' for an rgb24 stream
+FRAMES_DIR = './frames'
+RAW_PATH = './replay.rgb'       # '-' writes the raw stream to stdout
+
+FRAME_DT = 60.0                 # simulation seconds per frame
+WORKERS = os.cpu_count()
+CHUNK_FRAMES = 64               # frames rendered per worker task
+PNG_COMPRESSION = 1
+
+UNIT_COLOR = "#FFFFFF"
+
+
+_scene = None   # per-worker scene, set by _init_worker
+
+
+
+
+def hex_to_rgb(color):
+    color = color.lstrip('#')
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def load_scene(path=INPUT_PATH, outcome_path=OUTCOME_PATH):
+    """
+    Turn the simulator position log and outcome table into flat arrays the
+    workers rasterize from. An emergency is drawn from its call time until its
+    unit arrives, or until expire_time if no unit ever reached it.
+    """
+    data = pd.read_csv(path, index_col=0)
+    data = data.sort_values(by=['t'])
+    row_t = data['t'].to_numpy(dtype=float)
+
+    # unit positions, one (rows, units) array per axis
+    unit_names = [c[:-2] for c in data.columns if c.endswith('-x') and c[:-2] + '-y' in data.columns]
+    unit_x = data[[n + '-x' for n in unit_names]].to_numpy(dtype=float)
+    unit_y = data[[n + '-y' for n in unit_names]].to_numpy(dtype=float)
+
+    # time each emergency left the board
+    outcomes = pd.read_csv(outcome_path).set_index('id')
+    left_t = outcomes['arrival_time'].fillna(outcomes['expire_time'].where(outcomes['outcome'] == 'expired'))
+    resolved_t = data['id'].map(left_t).fillna(np.inf).to_numpy(dtype=float)
+
+    palette = [hex_to_rgb(BG_COLOR), hex_to_rgb(UNIT_COLOR), hex_to_rgb(UNKNOWN_COLOR)]
+    emerg_color = pd.Series(2, index=data.index)
+    for etype, color in EMERGENCY_COLORS.items():
+        emerg_color[data['etype'] == etype] = len(palette)
+        palette.append(hex_to_rgb(color))
+
+    stations = build_initial_stations()
+    station_x = np.array([sx for _, _, sx, _, _ in stations], dtype=float)
+    station_y = np.array([sy for _, _, _, sy, _ in stations], dtype=float)
+    station_color = []
+    for _, stype, _, _, _ in stations:
+        station_color.append(len(palette))
+        palette.append(hex_to_rgb(STATION_COLORS.get(stype, UNKNOWN_COLOR)))
+
+    return {
+        'row_t': row_t,
+        'unit_x': unit_x,
+        'unit_y': unit_y,
+        'emerg_x': data['x'].to_numpy(dtype=float),
+        'emerg_y': data['y'].to_numpy(dtype=float),
+        'emerg_t': row_t,
+        'emerg_resolved_t': resolved_t,
+        'emerg_color': emerg_color.to_numpy(dtype=np.uint8),
+        'station_x': station_x,
+        'station_y': station_y,
+        'station_color': np.array(station_color, dtype=np.uint8),
+        'palette': np.array(palette, dtype=np.uint8),
+    }
+
+
+def frame_times(scene, frame_dt=FRAME_DT):
+    row_t = scene['row_t']
+    return np.arange(row_t[0], row_t[-1] + frame_dt, frame_dt)
+
+
+def rasterize(scene, times):
+    """
+    Render len(times) frames at once into a (F, H*ZOOM, W*ZOOM, 3) uint8 buffer.
+    Layers are painted back to front: emergencies, units, stations.
+    """
+    n_frames = len(times)
+    frames = np.zeros((n_frames, GRID_H, GRID_W), dtype=np.uint8)    # palette indices
+
+    def paint(f, x, y, color):
+        ix = np.rint(x).astype(np.int64)
+        iy = np.rint(y).astype(np.int64)
+        inside = (ix >= 0) & (ix < GRID_W) & (iy >= 0) & (iy < GRID_H)
+        frames[f[inside], iy[inside], ix[inside]] = color[inside]
+
+    # active emergencies
+    active = ((scene['emerg_t'][None, :] <= times[:, None])
+              & (scene['emerg_resolved_t'][None, :] > times[:, None]))
+    f, e = np.nonzero(active)
+    paint(f, scene['emerg_x'][e], scene['emerg_y'][e], scene['emerg_color'][e])
+
+    # units at their last logged position
+    row = np.clip(np.searchsorted(scene['row_t'], times, side='right') - 1, 0, None)
+    ux, uy = scene['unit_x'][row], scene['unit_y'][row]
+    f = np.repeat(np.arange(n_frames), ux.shape[1])
+    paint(f, ux.ravel(), uy.ravel(), np.ones(f.shape, dtype=np.uint8))
+
+    # stations
+    n_stations = len(scene['station_x'])
+    f = np.repeat(np.arange(n_frames), n_stations)
+    paint(f, np.tile(scene['station_x'], n_frames), np.tile(scene['station_y'], n_frames),
+          np.tile(scene['station_color'], n_frames))
+
+    rgb = scene['palette'][frames]
+    return rgb.repeat(ZOOM, axis=1).repeat(ZOOM, axis=2)
+
+
+def encode_png(rgb, level=PNG_COMPRESSION):
+    """Minimal 8-bit truecolor PNG encoder."""
+    height, width, _ = rgb.shape
+    raw = np.zeros((height, width * 3 + 1), dtype=np.uint8)     # filter byte 0 per scanline
+    raw[:, 1:] = rgb.reshape(height, width * 3)
+
+    def chunk(tag, payload):
+        body = tag + payload
+        return struct.pack('>I', len(payload)) + body + struct.pack('>I', zlib.crc32(body) & 0xFFFFFFFF)
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', header)
+            + chunk(b'IDAT', zlib.compress(raw.tobytes(), level))
+            + chunk(b'IEND', b''))
+
+
+def _init_worker(scene):
+    global _scene
+    _scene = scene
+
+
+def _render_png_chunk(task):
+    start, times, out_dir = task
+    for i, rgb in enumerate(rasterize(_scene, times)):
+        with open(os.path.join(out_dir, f"frame_{start + i:06d}.png"), 'wb') as f:
+            f.write(encode_png(rgb))
+    return len(times)
+
+
+def _render_raw_chunk(times):
+    return rasterize(_scene, times).tobytes()
+
+
+def export(scene, output_format=OUTPUT_FORMAT, frame_dt=FRAME_DT, workers=WORKERS):
+    """Split the frame range across worker processes and write the replay."""
+    times = frame_times(scene, frame_dt)
+    starts = range(0, len(times), CHUNK_FRAMES)
+
+    with Pool(workers, initializer=_init_worker, initargs=(scene,)) as pool:
+        if output_format == 'png':
+            os.makedirs(FRAMES_DIR, exist_ok=True)
+            tasks = [(s, times[s:s + CHUNK_FRAMES], FRAMES_DIR) for s in starts]
+            for _ in pool.imap_unordered(_render_png_chunk, tasks):
+                pass
+            dest = FRAMES_DIR
+        elif output_format == 'raw':
+            tasks = [times[s:s + CHUNK_FRAMES] for s in starts]
+            out = sys.stdout.buffer if RAW_PATH == '-' else open(RAW_PATH, 'wb')
+            try:
+                for block in pool.imap(_render_raw_chunk, tasks):   # imap keeps frame order
+                    out.write(block)
+            finally:
+                if out is not sys.stdout.buffer:
+                    out.close()
+            dest = RAW_PATH
+        else:
+            raise ValueError(f"Unknown output format '{output_format}'")
+
+    return len(times), dest
+
+
+def main():
+    scene = load_scene(INPUT_PATH, OUTCOME_PATH)
+    n_frames, dest = export(scene)
+
+    # keep stdout clean when it carries the raw stream
+    log = sys.stderr if OUTPUT_FORMAT == 'raw' and RAW_PATH == '-' else sys.stdout
+    print(f"Rendered {n_frames} frames ({GRID_W * ZOOM}x{GRID_H * ZOOM}) to {dest}", file=log)
+    if OUTPUT_FORMAT == 'raw':
+        print(f"ffmpeg -f rawvideo -pix_fmt rgb24 -s {GRID_W * ZOOM}x{GRID_H * ZOOM} -r 30 -i {RAW_PATH} replay.mp4",
+              file=log)
+
+
+
+if __name__ == "__main__":
+    main()